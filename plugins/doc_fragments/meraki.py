@@ -81,4 +81,16 @@ options:
         - Number of seconds to retry if server returns an internal server error.
         type: int
         default: 60
+    cache_ttl:
+        description:
+        - Number of seconds to reuse organization, network and configuration template lookups, and other read-only lookups
+          supported by a module, across tasks.
+        - Responses are stored in C(~/.ansible/tmp/meraki_cache) on the host running the module, keyed by URL and API key.
+        - Changes made within this time window by other tools, by tasks using a different API key, or by tasks without
+          C(cache_ttl) may not be seen until the cached response expires.
+        - Tasks with C(cache_ttl) set remove the cached responses their changes affect, for example the network list when a
+          network is created.
+        - Set to C(0) to disable caching.
+        type: int
+        default: 0
 '''
@@ -6,17 +6,43 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import hashlib
+import os
+import tempfile
 import time
 import re
 from ansible.module_utils.basic import json, env_fallback
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict, snake_dict_to_camel_dict, recursive_diff
 from ansible.module_utils.urls import fetch_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
-from ansible.module_utils._text import to_native
+from ansible.module_utils._text import to_bytes, to_native
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 RATE_LIMIT_RETRY_MULTIPLIER = 3
 INTERNAL_ERROR_RETRY_MULTIPLIER = 3
+CACHE_DIR = '~/.ansible/tmp/meraki_cache'
+
+# Responses cached by cached_get() are grouped by the list they hold
+CACHE_GROUPS = ((re.compile(r'^/organizations/?$'), 'organizations'),
+                (re.compile(r'^/organizations/[^/]+/networks'), 'networks'),
+                (re.compile(r'^/organizations/[^/]+/configTemplates'), 'configTemplates'),
+                (re.compile(r'^/networks/[^/]+/appliance/vlans'), 'vlans'),
+                )
+
+# Groups of cached responses which a POST, PUT or DELETE to a path can change
+CACHE_INVALIDATIONS = ((re.compile(r'^/organizations(/[^/]+(/clone)?)?/?$'), ('organizations',)),
+                       (re.compile(r'^/organizations/[^/]+/networks'), ('networks',)),
+                       (re.compile(r'^/networks/[^/]+(/bind|/unbind|/split)?/?$'), ('networks',)),
+                       (re.compile(r'^/organizations/[^/]+/configTemplates'), ('configTemplates',)),
+                       (re.compile(r'^/networks/[^/]+/appliance/vlans'), ('vlans',)),
+                       (re.compile(r'^/organizations/[^/]+/actionBatches'), ('networks', 'configTemplates', 'vlans')),
+                       )
 
 
 def meraki_argument_spec():
@@ -31,10 +57,16 @@ def meraki_argument_spec():
                 org_name=dict(type='str', aliases=['organization']),
                 org_id=dict(type='str'),
                 rate_limit_retry_time=dict(type='int', default=165),
-                internal_error_retry_time=dict(type='int', default=60)
+                internal_error_retry_time=dict(type='int', default=60),
+                cache_ttl=dict(type='int', default=0),
                 )
 
 
+def only_set(params, pairs):
+    """Map parameter names to API keys, skipping parameters which weren't set."""
+    return dict((api, value) for api, value in ((api, params.get(key)) for key, api in pairs) if value is not None)
+
+
 class RateLimitException(Exception):
     def __init__(self, *args, **kwargs):
         Exception.__init__(self, *args, **kwargs)
@@ -60,6 +92,7 @@ class MerakiModule(object):
         self.function = function
         self.orgs = None
         self.nets = None
+        self.nets_by_org = {}
         self.org_id = None
         self.net_id = None
         self.check_mode = module.check_mode
@@ -131,6 +164,20 @@ class MerakiModule(object):
                         'Authorization': 'Bearer {key}'.format(key=module.params['auth_key']),
                         }
 
+    @staticmethod
+    def dumps(data):
+        """Serialize a request body to compact JSON, using orjson when it is installed."""
+        if HAS_ORJSON:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(',', ':'))
+
+    @staticmethod
+    def loads(data):
+        """Parse a response body, using orjson when it is installed."""
+        if HAS_ORJSON:
+            return orjson.loads(data)
+        return json.loads(to_native(data))
+
     def define_protocol(self):
         """Set protocol based on use_https parameters."""
         if self.params['use_https'] is True:
@@ -210,9 +257,94 @@ class MerakiModule(object):
             self.result['diff'] = {'before': diff[0]['data'],
                                    'after': diff[1]['data']}
 
+    def clear_lookup_cache(self):
+        """Forget organizations and networks downloaded by get_orgs() and get_nets()."""
+        self.orgs = None
+        self.nets_by_org = {}
+
+    @staticmethod
+    def _cache_group(path):
+        """Returns the group of a cached GET path, or None for paths outside the known lists."""
+        path = '/' + path.split('?')[0].lstrip('/')
+        for pattern, group in CACHE_GROUPS:
+            if pattern.match(path):
+                return group
+        return None
+
+    def invalidate_cached_responses(self, path):
+        """Remove responses cached on disk which a POST, PUT or DELETE to path can change.
+
+        Responses outside the known groups are removed by every write. Nothing is done when cache_ttl is 0.
+        """
+        if not self.params['cache_ttl']:
+            return
+        path = '/' + path.split('?')[0].lstrip('/')
+        groups = set(['other'])
+        for pattern, changed in CACHE_INVALIDATIONS:
+            if pattern.match(path):
+                groups.update(changed)
+        cache_dir = self._cache_dir()
+        try:
+            cache_files = os.listdir(cache_dir)
+        except OSError:
+            return
+        for cache_file in cache_files:
+            if cache_file.split('-')[0] in groups:
+                try:
+                    os.remove(os.path.join(cache_dir, cache_file))
+                except OSError:
+                    pass
+
+    def _cache_dir(self):
+        """Directory holding the responses cached by cached_get() for the API key."""
+        key = hashlib.sha256(to_bytes(self.params['auth_key'])).hexdigest()
+        return os.path.join(os.path.expanduser(CACHE_DIR), key)
+
+    def cached_get(self, path, pagination_items=None):
+        """GET a path, reusing a response stored on disk within the last cache_ttl seconds.
+
+        Responses are stored per URL in a directory per API key, and named after the group of the path so
+        invalidate_cached_responses() can find them. Caching is disabled when cache_ttl is 0.
+        """
+        ttl = self.params['cache_ttl']
+        if not ttl:
+            return self.request(path, method='GET', pagination_items=pagination_items)
+        self._set_url(path, 'GET', None)
+        cache_dir = self._cache_dir()
+        cache_file = os.path.join(cache_dir, '{0}-{1}.json'.format(self._cache_group(self.path) or 'other',
+                                                                   hashlib.sha256(to_bytes(self.url)).hexdigest()))
+        try:
+            if time.time() - os.path.getmtime(cache_file) < ttl:
+                with open(cache_file) as f:
+                    data = json.load(f)
+                self.status = 200
+                return data
+        except (IOError, OSError, ValueError):
+            pass
+        data = self.request(path, method='GET', pagination_items=pagination_items)
+        if self.status == 200:
+            try:
+                if not os.path.isdir(cache_dir):
+                    # makedirs() only applies the mode to the last directory on Python 3.7+
+                    if not os.path.isdir(os.path.dirname(cache_dir)):
+                        os.makedirs(os.path.dirname(cache_dir), 0o700)
+                    os.mkdir(cache_dir, 0o700)
+                fd, tmp_file = tempfile.mkstemp(dir=cache_dir)
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f)
+                os.rename(tmp_file, cache_file)
+            except (IOError, OSError):
+                self.module.warn('Unable to write Meraki response cache to {0}'.format(cache_dir))
+        return data
+
     def get_orgs(self):
-        """Downloads all organizations for a user."""
-        response = self.request('/organizations', method='GET')
+        """Downloads all organizations for a user.
+
+        The list is downloaded once and reused until a request modifies data.
+        """
+        if self.orgs is not None:
+            return self.orgs
+        response = self.cached_get('/organizations')
         if self.status != 200:
             self.fail_json(msg='Organization lookup failed')
         self.orgs = response
@@ -256,17 +388,24 @@ class MerakiModule(object):
                     return str(i['id'])
 
     def get_nets(self, org_name=None, org_id=None):
-        """Downloads all networks in an organization."""
+        """Downloads all networks in an organization.
+
+        Networks are downloaded once per organization and reused until a request modifies data.
+        """
         if org_name:
             org_id = self.get_org_id(org_name)
+        if org_id in self.nets_by_org:
+            self.nets = self.nets_by_org[org_id]
+            return self.nets
         path = self.construct_path('get_all', org_id=org_id, function='network', params={'perPage': '1000'})
-        r = self.request(path, method='GET', pagination_items=1000)
+        r = self.cached_get(path, pagination_items=1000)
         if self.status != 200:
             self.fail_json(msg='Network lookup failed')
         self.nets = r
         templates = self.get_config_templates(org_id)
         for t in templates:
             self.nets.append(t)
+        self.nets_by_org[org_id] = self.nets
         return self.nets
 
     def get_net(self, org_name, net_name=None, org_id=None, data=None, net_id=None):
@@ -284,10 +423,15 @@ class MerakiModule(object):
                     return n
         return False
 
-    def get_net_id(self, org_name=None, net_name=None, data=None):
-        """Return network id from lookup or existing data."""
+    def get_net_id(self, org_name=None, net_name=None, data=None, org_id=None):
+        """Return network id from lookup or existing data.
+
+        Networks are looked up with get_nets() when data isn't provided.
+        """
         if data is None:
-            self.fail_json(msg='Must implement lookup')
+            if org_name is None and org_id is None:
+                self.fail_json(msg='org_name or org_id is required to look up a network by name')
+            data = self.get_nets(org_name=org_name, org_id=org_id)
         for n in data:
             if n['name'] == net_name:
                 return n['id']
@@ -295,7 +439,7 @@ class MerakiModule(object):
 
     def get_config_templates(self, org_id):
         path = self.construct_path('get_all', function='configTemplates', org_id=org_id)
-        response = self.request(path, 'GET')
+        response = self.cached_get(path)
         if self.status != 200:
             self.fail_json(msg='Unable to get configuration templates')
         return response
@@ -394,7 +538,19 @@ class MerakiModule(object):
             rels[kv[1]] = kv[0].split('<')[1].split('>')[0].strip()  # This should return just the URL for <url>
         return rels
 
-    def _execute_request(self, path, method=None, payload=None, params=None):
+    @staticmethod
+    def _retry_after(info, default=5):
+        """Returns the number of seconds to wait after a rate limited request.
+
+        fetch_url lowercases header names and returns header values as strings.
+        Retry-After isn't returned for over 10 concurrent connections per IP.
+        """
+        try:
+            return max(int(info['retry-after']), 1)
+        except (KeyError, TypeError, ValueError):
+            return default
+
+    def _execute_request(self, path, method=None, payload=None, params=None, ignored_codes=None):
         """ Execute query """
         try:
             resp, info = fetch_url(self.module, self.url,
@@ -406,17 +562,15 @@ class MerakiModule(object):
                                    )
             self.status = info['status']
 
-            if self.status == 429:
+            if ignored_codes and self.status in ignored_codes:
+                pass
+            elif self.status == 429:
                 self.retry += 1
                 if self.retry <= 10:
-                    # retry-after isn't returned for over 10 concurrent connections per IP
-                    try:
-                        self.module.warn("Rate limiter hit, retry {0}...pausing for {1} seconds".format(self.retry, info['Retry-After']))
-                        time.sleep(info['Retry-After'])
-                    except KeyError:
-                        self.module.warn("Rate limiter hit, retry {0}...pausing for 5 seconds".format(self.retry))
-                        time.sleep(5)
-                    return self._execute_request(path, method=method, payload=payload, params=params)
+                    delay = self._retry_after(info)
+                    self.module.warn("Rate limiter hit, retry {0}...pausing for {1} seconds".format(self.retry, delay))
+                    time.sleep(delay)
+                    return self._execute_request(path, method=method, payload=payload, params=params, ignored_codes=ignored_codes)
                 else:
                     self.fail_json(msg="Rate limit retries failed for {url}".format(url=self.url))
             elif self.status == 500:
@@ -425,7 +579,7 @@ class MerakiModule(object):
                 if self.retry <= 10:
                     self.retry_time += self.retry * INTERNAL_ERROR_RETRY_MULTIPLIER
                     time.sleep(self.retry_time)
-                    return self._execute_request(path, method=method, payload=payload, params=params)
+                    return self._execute_request(path, method=method, payload=payload, params=params, ignored_codes=ignored_codes)
                 else:
                     # raise RateLimitException(e)
                     self.fail_json(msg="Rate limit retries failed for {url}".format(url=self.url))
@@ -444,17 +598,26 @@ class MerakiModule(object):
         self.retry = 0  # Needs to reset in case of future retries
         return resp, info
 
-    def request(self, path, method=None, payload=None, params=None, pagination_items=None):
-        """ Submit HTTP request to Meraki API """
+    def request(self, path, method=None, payload=None, params=None, pagination_items=None, ignored_codes=None):
+        """ Submit HTTP request to Meraki API
+
+        Status codes listed in ignored_codes are not treated as failures. The
+        status is available in self.status and None is returned.
+        """
         self._set_url(path, method, params)
+        if self.method in self.modifiable_methods:
+            self.clear_lookup_cache()
+            self.invalidate_cached_responses(self.path)
 
         try:
             # Gather the body (resp) and header (info)
-            resp, info = self._execute_request(path, method=method, payload=payload, params=params)
+            resp, info = self._execute_request(path, method=method, payload=payload, params=params, ignored_codes=ignored_codes)
         except HTTPError:
             self.fail_json(msg="HTTP request to {url} failed with error code {code}".format(url=self.url, code=self.status))
         self.response = info['msg']
         self.status = info['status']
+        if ignored_codes and self.status in ignored_codes:
+            return None
         # This needs to be refactored as it's not very clean
         # Looping process for pagination
         if pagination_items is not None:
@@ -462,7 +625,7 @@ class MerakiModule(object):
             if 'body' in info:
                 self.body = info['body']
             try:
-                data = json.loads(to_native(resp.read()))
+                data = self.loads(resp.read())
             except AttributeError:
                 self.fail_json(msg="Failure occurred during pagination",
                                response=self.response,
@@ -479,7 +642,7 @@ class MerakiModule(object):
                     self.fail_json(msg="HTTP request to {url} failed with error code {code}".format(url=self.url, code=self.status))
                 header_link = self._parse_pagination_header(info['link'])
                 try:
-                    data.extend(json.loads(to_native(resp.read())))
+                    data.extend(self.loads(resp.read()))
                 except AttributeError:
                     self.fail_json(msg="Failure occurred during pagination",
                                    response=self.response,
@@ -491,7 +654,7 @@ class MerakiModule(object):
             if 'body' in info:
                 self.body = info['body']
             try:
-                return json.loads(to_native(resp.read()))
+                return self.loads(resp.read())
             except json.decoder.JSONDecodeError:
                 return {}
             except AttributeError:
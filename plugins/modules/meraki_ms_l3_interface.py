@@ -202,32 +202,28 @@ data:
                     sample: true
 '''
 
-from ansible.module_utils.basic import AnsibleModule, json
-from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import MerakiModule, meraki_argument_spec
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import MerakiModule, meraki_argument_spec, only_set
+
+
+INTERFACE_FIELDS = (('name', 'name'),
+                    ('subnet', 'subnet'),
+                    ('interface_ip', 'interfaceIp'),
+                    ('multicast_routing', 'multicastRouting'),
+                    ('vlan_id', 'vlanId'),
+                    ('default_gateway', 'defaultGateway'),
+                    )
+
+OSPF_FIELDS = (('area', 'area'),
+               ('cost', 'cost'),
+               ('is_passive_enabled', 'isPassiveEnabled'),
+               )
 
 
 def construct_payload(meraki):
-    payload = {}
-    if meraki.params['name'] is not None:
-        payload['name'] = meraki.params['name']
-    if meraki.params['subnet'] is not None:
-        payload['subnet'] = meraki.params['subnet']
-    if meraki.params['interface_ip'] is not None:
-        payload['interfaceIp'] = meraki.params['interface_ip']
-    if meraki.params['multicast_routing'] is not None:
-        payload['multicastRouting'] = meraki.params['multicast_routing']
-    if meraki.params['vlan_id'] is not None:
-        payload['vlanId'] = meraki.params['vlan_id']
-    if meraki.params['default_gateway'] is not None:
-        payload['defaultGateway'] = meraki.params['default_gateway']
+    payload = only_set(meraki.params, INTERFACE_FIELDS)
     if meraki.params['ospf_settings'] is not None:
-        payload['ospfSettings'] = {}
-        if meraki.params['ospf_settings']['area'] is not None:
-            payload['ospfSettings']['area'] = meraki.params['ospf_settings']['area']
-        if meraki.params['ospf_settings']['cost'] is not None:
-            payload['ospfSettings']['cost'] = meraki.params['ospf_settings']['cost']
-        if meraki.params['ospf_settings']['is_passive_enabled'] is not None:
-            payload['ospfSettings']['isPassiveEnabled'] = meraki.params['ospf_settings']['is_passive_enabled']
+        payload['ospfSettings'] = only_set(meraki.params['ospf_settings'], OSPF_FIELDS)
     return payload
 
 
@@ -287,9 +283,7 @@ def main():
 
     meraki.url_catalog['get_all'].update(query_urls)
     meraki.url_catalog['get_one'].update(query_one_urls)
-    meraki.url_catalog['create'] = create_urls
-    meraki.url_catalog['update'] = update_urls
-    meraki.url_catalog['delete'] = delete_urls
+    meraki.url_catalog.update(create=create_urls, update=update_urls, delete=delete_urls)
 
     payload = None
 
@@ -328,7 +322,7 @@ def main():
                 meraki.result['changed'] = True
                 meraki.exit_json(**meraki.result)
             path = meraki.construct_path('create', custom={'serial': meraki.params['serial']})
-            response = meraki.request(path, method='POST', payload=json.dumps(payload))
+            response = meraki.request(path, method='POST', payload=meraki.dumps(payload))
             meraki.result['data'] = response
             meraki.result['changed'] = True
             meraki.exit_json(**meraki.result)
@@ -346,9 +340,14 @@ def main():
                     meraki.exit_json(**meraki.result)
                 path = meraki.construct_path('update', custom={'serial': meraki.params['serial'],
                                                                'interface_id': interface_id})
-                response = meraki.request(path, method='PUT', payload=json.dumps(payload))
+                response = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
                 meraki.result['data'] = response
-                meraki.result['changed'] = True
+                # The API may normalize the request so the interface ends up unchanged
+                if response:
+                    applied = dict((key, response[key]) for key in payload if key in response)
+                    meraki.result['changed'] = meraki.is_update_required(interface, applied)
+                else:
+                    meraki.result['changed'] = True
                 meraki.exit_json(**meraki.result)
             else:
                 meraki.result['data'] = interface
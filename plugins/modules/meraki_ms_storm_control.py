@@ -106,7 +106,7 @@ data:
             sample: 42
 '''
 
-from ansible.module_utils.basic import AnsibleModule, json
+from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.dict_transformations import recursive_diff
 from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import MerakiModule, meraki_argument_spec
 
@@ -140,6 +140,7 @@ def main():
     # supports check mode
     module = AnsibleModule(argument_spec=argument_spec,
                            supports_check_mode=True,
+                           required_one_of=[('net_id', 'net_name')],
                            )
     meraki = MerakiModule(module, function='switch_storm_control')
     meraki.params['follow_redirects'] = 'all'
@@ -152,13 +153,12 @@ def main():
 
     payload = None
 
-    org_id = meraki.params['org_id']
-    if not org_id:
-        org_id = meraki.get_org_id(meraki.params['org_name'])
     net_id = meraki.params['net_id']
     if net_id is None:
-        nets = meraki.get_nets(org_id=org_id)
-        net_id = meraki.get_net_id(net_name=meraki.params['net_name'], data=nets)
+        org_id = meraki.params['org_id']
+        if not org_id:
+            org_id = meraki.get_org_id(meraki.params['org_name'])
+        net_id = meraki.get_net_id(net_name=meraki.params['net_name'], org_id=org_id)
 
     # execute checks for argument completeness
 
@@ -183,7 +183,7 @@ def main():
                                          'after': diff[1]}
                 meraki.exit_json(**meraki.result)
             path = meraki.construct_path('update', net_id=net_id)
-            response = meraki.request(path, method='PUT', payload=json.dumps(payload))
+            response = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
             if meraki.status == 200:
                 meraki.result['diff'] = {'before': diff[0],
                                          'after': diff[1]}
@@ -77,7 +77,160 @@ options:
     number:
         description:
         - Port number.
+        - Mutually exclusive with C(ports).
         type: str
+    ports:
+        description:
+        - List of ports to configure in a single task.
+        - Current settings for all ports are retrieved with one request and only ports which need changes are updated.
+        - When set, top-level port options such as C(name) or C(vlan) are ignored.
+        - Only supported with C(state=present). The module fails when C(ports) is combined with C(state=query).
+        - Mutually exclusive with C(number).
+        type: list
+        elements: dict
+        suboptions:
+            number:
+                description:
+                - Port number.
+                type: str
+                required: true
+            access_policy_type:
+                description:
+                - Type of access policy to apply to port.
+                type: str
+                choices: [Open, Custom access policy, MAC allow list, Sticky MAC allow list]
+            access_policy_number:
+                description:
+                - Number of the access policy to apply.
+                - Only applicable to access port types.
+                type: int
+            allowed_vlans:
+                description:
+                - List of VLAN numbers to be allowed on switchport.
+                default: all
+                type: list
+                elements: str
+            enabled:
+                description:
+                - Whether a switchport should be enabled or disabled.
+                type: bool
+                default: yes
+            isolation_enabled:
+                description:
+                - Isolation status of switchport.
+                default: no
+                type: bool
+            link_negotiation:
+                description:
+                - Link speed for the switchport.
+                default: Auto negotiate
+                choices: [1 Gigabit full duplex (auto),
+                        1 Gigabit full duplex (forced),
+                        10 Gigabit full duplex (auto),
+                        10 Gigabit full duplex (forced),
+                        100 Megabit (auto),
+                        100 Megabit full duplex (forced),
+                        2.5 Gigabit full duplex (auto),
+                        2.5 Gigabit full duplex (forced),
+                        5 Gigabit full duplex (auto),
+                        5 Gigabit full duplex (forced),
+                        Auto negotiate]
+                type: str
+            name:
+                description:
+                - Switchport description.
+                aliases: [description]
+                type: str
+            poe_enabled:
+                description:
+                - Enable or disable Power Over Ethernet on a port.
+                type: bool
+                default: true
+            rstp_enabled:
+                description:
+                - Enable or disable Rapid Spanning Tree Protocol on a port.
+                type: bool
+                default: true
+            stp_guard:
+                description:
+                - Set state of STP guard.
+                choices: [disabled, root guard, bpdu guard, loop guard]
+                default: disabled
+                type: str
+            tags:
+                description:
+                - List of tags to assign to a port.
+                type: list
+                elements: str
+            type:
+                description:
+                - Set port type.
+                choices: [access, trunk]
+                default: access
+                type: str
+            vlan:
+                description:
+                - VLAN number assigned to port.
+                - If a port is of type trunk, the specified VLAN is the native VLAN.
+                - Setting value to 0 on a trunk will clear the VLAN.
+                type: int
+            voice_vlan:
+                description:
+                - VLAN number assigned to a port for voice traffic.
+                - Only applicable to access port type.
+                - Only applicable if voice_vlan_state is set to present.
+                type: int
+            voice_vlan_state:
+                description:
+                - Specifies whether voice vlan configuration should be present or absent.
+                choices: [absent, present]
+                default: present
+                type: str
+            mac_allow_list:
+                description:
+                - MAC addresses list that are allowed on a port.
+                - Only applicable to access port type.
+                - Only applicable to access_policy_type "MAC allow list".
+                type: dict
+                suboptions:
+                    state:
+                        description:
+                        - The state the configuration should be left in.
+                        type: str
+                        choices: [merged, replaced, deleted]
+                        default: replaced
+                    macs:
+                        description:
+                        - List of MAC addresses to update with based on state option.
+                        type: list
+                        elements: str
+            sticky_mac_allow_list:
+                description:
+                - MAC addresses list that are allowed on a port.
+                - Only applicable to access port type.
+                - Only applicable to access_policy_type "Sticky MAC allow list".
+                type: dict
+                suboptions:
+                    state:
+                        description:
+                        - The state the configuration should be left in.
+                        type: str
+                        choices: [merged, replaced, deleted]
+                        default: replaced
+                    macs:
+                        description:
+                        - List of MAC addresses to update with based on state option.
+                        type: list
+                        elements: str
+            sticky_mac_allow_list_limit:
+                description:
+                - The number of MAC addresses allowed in the sticky port allow list.
+                - Only applicable to access port type.
+                type: int
+            flexible_stacking_enabled:
+                description:
+                - Whether flexible stacking capabilities are supported on the port.
+                type: bool
     poe_enabled:
         description:
         - Enable or disable Power Over Ethernet on a port.
@@ -255,6 +408,20 @@ EXAMPLES = r"""
       - 20
   delegate_to: localhost
 
+- name: Configure several ports in one task
+  meraki_switchport:
+    auth_key: abc12345
+    state: present
+    serial: ABC-123
+    ports:
+      - number: 7
+        name: Desk 7
+        vlan: 10
+      - number: 8
+        name: Desk 8
+        vlan: 10
+  delegate_to: localhost
+
 - name: Configure access port with sticky MAC allow list and limit.
   meraki_switchport:
     auth_key: abc12345
@@ -407,7 +574,7 @@ data:
             type: bool
 """
 
-from ansible.module_utils.basic import AnsibleModule, json
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import (
     MerakiModule,
     meraki_argument_spec,
@@ -439,31 +606,18 @@ param_map = {
 
 
 def sort_vlans(meraki, vlans):
-    converted = set()
-    for vlan in vlans:
-        converted.add(int(vlan))
-    vlans_sorted = sorted(converted)
-    vlans_str = []
-    for vlan in vlans_sorted:
-        vlans_str.append(str(vlan))
-    return ",".join(vlans_str)
-
-
-def assemble_payload(meraki):
-    payload = dict()
-    # if meraki.params['enabled'] is not None:
-    #     payload['enabled'] = meraki.params['enabled']
-
-    for k, v in meraki.params.items():
-        try:
-            if meraki.params[k] is not None:
-                if k == "access_policy_number":
-                    if meraki.params["access_policy_type"] is not None:
-                        payload[param_map[k]] = v
-                else:
-                    payload[param_map[k]] = v
-        except KeyError:
-            pass
+    return ",".join(map(str, sorted(set(int(vlan) for vlan in vlans))))
+
+
+def assemble_payload(params):
+    payload = {
+        api_key: params[param]
+        for param, api_key in param_map.items()
+        if params.get(param) is not None
+    }
+    # An access policy number is only meaningful with an access policy type
+    if params.get("access_policy_type") is None:
+        payload.pop("accessPolicyNumber", None)
     return payload
 
 
@@ -481,6 +635,92 @@ def clear_vlan(params, payload):
     return payload
 
 
+def port_matches(original, proposed):
+    """Return True when every proposed value other than the port number is already configured."""
+    return all(
+        key in original and original[key] == value
+        for key, value in proposed.items()
+        if key != "number"
+    )
+
+
+def normalize_port_params(meraki, params):
+    if params.get("voice_vlan_state") == "absent" and params.get("voice_vlan"):
+        meraki.fail_json(
+            msg="voice_vlan_state cant be `absent` while voice_vlan is also defined."
+        )
+    if params["type"] == "trunk":
+        if not params["allowed_vlans"]:
+            params["allowed_vlans"] = [
+                "all"
+            ]  # Backdoor way to set default without conflicting on access
+
+
+def construct_port_payload(meraki, params, original):
+    """Return the payload to send for a port and the values to compare with its current configuration."""
+    port_type = params["type"]
+    allowed_vlans = params["allowed_vlans"]
+    vlan = params["vlan"]
+    payload = assemble_payload(params)
+    # meraki.fail_json(msg='payload', payload=payload)
+    if allowed_vlans[0] == "all":
+        payload["allowedVlans"] = "all"
+    elif len(allowed_vlans) == 1 and vlan is None:
+        payload["allowedVlans"] = str(allowed_vlans[0])
+    else:
+        # Use a set to remove duplicate items
+        allowed = set(str(allowed_vlan) for allowed_vlan in allowed_vlans)
+        if vlan is not None:
+            allowed.add(str(vlan))
+        if len(allowed) > 1:  # Convert from list to comma separated
+            payload["allowedVlans"] = sort_vlans(meraki, allowed)
+        else:
+            payload["allowedVlans"] = next(iter(allowed))
+
+    # Exceptions need to be made for idempotency check based on how Meraki returns
+    if port_type == "access":
+        # VLAN needs to be specified in access ports, but can't default to it
+        if not vlan:
+            payload["vlan"] = 1
+    # Check voiceVlan to see if state is absent to remove the vlan.
+    if params.get("voice_vlan_state"):
+        if params.get("voice_vlan_state") == "absent":
+            payload["voiceVlan"] = None
+        else:
+            payload["voiceVlan"] = params.get("voice_vlan")
+    if params.get("mac_allow_list"):
+        macs = get_mac_list(
+            original.get("macAllowList"),
+            params["mac_allow_list"].get("macs"),
+            params["mac_allow_list"].get("state"),
+        )
+        payload["macAllowList"] = macs
+    # Evaluate Sticky Limit whether it was passed in or what is currently configured and was returned in GET call.
+    if params.get("sticky_mac_allow_list_limit"):
+        sticky_mac_limit = params.get("sticky_mac_allow_list_limit")
+    else:
+        sticky_mac_limit = original.get("stickyMacAllowListLimit")
+    if params.get("sticky_mac_allow_list"):
+        macs = get_mac_list(
+            original.get("stickyMacAllowList"),
+            params["sticky_mac_allow_list"].get("macs"),
+            params["sticky_mac_allow_list"].get("state"),
+        )
+        if int(sticky_mac_limit) < len(macs):
+            meraki.fail_json(
+                msg="Stick MAC Allow List Limit must be equal to or greater than length of Sticky MAC Allow List."
+            )
+        payload["stickyMacAllowList"] = macs
+        payload["stickyMacAllowListLimit"] = sticky_mac_limit
+    payload = clear_vlan(params, payload)
+    proposed = payload.copy()
+    if port_type == "trunk":
+        proposed["voiceVlan"] = original[
+            "voiceVlan"
+        ]  # API shouldn't include voice VLAN on a trunk port
+    return payload, proposed
+
+
 def main():
     # define the available arguments/parameters that a user can pass to
     # the module
@@ -493,10 +733,7 @@ def main():
         ),
     )
 
-    argument_spec.update(
-        state=dict(type="str", choices=["present", "query"], default="query"),
-        serial=dict(type="str", required=True),
-        number=dict(type="str"),
+    port_arg_spec = dict(
         name=dict(type="str", aliases=["description"]),
         tags=dict(type="list", elements="str"),
         enabled=dict(type="bool", default=True),
@@ -550,6 +787,17 @@ def main():
         flexible_stacking_enabled=dict(type="bool"),
     )
 
+    ports_arg_spec = dict(number=dict(type="str", required=True))
+    ports_arg_spec.update(port_arg_spec)
+
+    argument_spec.update(
+        state=dict(type="str", choices=["present", "query"], default="query"),
+        serial=dict(type="str", required=True),
+        number=dict(type="str"),
+        ports=dict(type="list", elements="dict", options=ports_arg_spec),
+    )
+    argument_spec.update(port_arg_spec)
+
     # the AnsibleModule object will be our abstraction working with Ansible
     # this includes instantiation, a couple of common attr would be the
     # args/params passed to the execution, as well as if the module
@@ -557,22 +805,15 @@ def main():
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
+        mutually_exclusive=[("number", "ports")],
     )
     meraki = MerakiModule(module, function="switchport")
-    if meraki.params.get("voice_vlan_state") == "absent" and meraki.params.get(
-        "voice_vlan"
-    ):
-        meraki.fail_json(
-            msg="voice_vlan_state cant be `absent` while voice_vlan is also defined."
-        )
+    params = meraki.params
+    normalize_port_params(meraki, params)
 
-    meraki.params["follow_redirects"] = "all"
-
-    if meraki.params["type"] == "trunk":
-        if not meraki.params["allowed_vlans"]:
-            meraki.params["allowed_vlans"] = [
-                "all"
-            ]  # Backdoor way to set default without conflicting on access
+    params["follow_redirects"] = "all"
+    state = params["state"]
+    serial = params["serial"]
 
     query_urls = {"switchport": "/devices/{serial}/switch/ports"}
     query_url = {"switchport": "/devices/{serial}/switch/ports/{number}"}
@@ -583,94 +824,76 @@ def main():
     meraki.url_catalog["update"] = update_url
 
     # execute checks for argument completeness
+    if state == "query" and params["ports"] is not None:
+        meraki.fail_json(msg="ports is only supported with state present")
 
     # manipulate or modify the state as needed (this is going to be the
     # part where your module will do what it needs to do)
-    if meraki.params["state"] == "query":
-        if meraki.params["number"]:
+    if state == "query":
+        if params["number"]:
             path = meraki.construct_path(
                 "get_one",
                 custom={
-                    "serial": meraki.params["serial"],
-                    "number": meraki.params["number"],
+                    "serial": serial,
+                    "number": params["number"],
                 },
             )
             response = meraki.request(path, method="GET")
             meraki.result["data"] = response
         else:
-            path = meraki.construct_path(
-                "get_all", custom={"serial": meraki.params["serial"]}
-            )
+            path = meraki.construct_path("get_all", custom={"serial": serial})
             response = meraki.request(path, method="GET")
             meraki.result["data"] = response
-    elif meraki.params["state"] == "present":
-        payload = assemble_payload(meraki)
-        # meraki.fail_json(msg='payload', payload=payload)
-        allowed = set()  # Use a set to remove duplicate items
-        if meraki.params["allowed_vlans"][0] == "all":
-            allowed.add("all")
-        else:
-            for vlan in meraki.params["allowed_vlans"]:
-                allowed.add(str(vlan))
-            if meraki.params["vlan"] is not None:
-                allowed.add(str(meraki.params["vlan"]))
-        if len(allowed) > 1:  # Convert from list to comma separated
-            payload["allowedVlans"] = sort_vlans(meraki, allowed)
-        else:
-            payload["allowedVlans"] = next(iter(allowed))
-
-        # Exceptions need to be made for idempotency check based on how Meraki returns
-        if meraki.params["type"] == "access":
-            if not meraki.params[
-                "vlan"
-            ]:  # VLAN needs to be specified in access ports, but can't default to it
-                payload["vlan"] = 1
+    elif state == "present" and params["ports"] is not None:
+        # Fetch every port once instead of one GET per port
+        path = meraki.construct_path("get_all", custom={"serial": serial})
+        current_ports = dict(
+            (port["portId"], port) for port in meraki.request(path, method="GET")
+        )
+        meraki.result["data"] = []
+        for port in params["ports"]:
+            normalize_port_params(meraki, port)
+            if port["number"] not in current_ports:
+                meraki.fail_json(
+                    msg="Port {0} was not found on switch {1}".format(
+                        port["number"], serial
+                    )
+                )
+            original = current_ports[port["number"]]
+            payload, proposed = construct_port_payload(meraki, port, original)
+            if port_matches(original, proposed) or not meraki.is_update_required(
+                original, proposed, optional_ignore=["number"]
+            ):
+                meraki.result["data"].append(original)
+                continue
+            meraki.result["changed"] = True
+            if meraki.check_mode is True:
+                original.update(proposed)
+                meraki.result["data"].append(original)
+                continue
+            path = meraki.construct_path(
+                "update",
+                custom={
+                    "serial": serial,
+                    "number": port["number"],
+                },
+            )
+            response = meraki.request(path, method="PUT", payload=meraki.dumps(payload))
+            meraki.result["data"].append(response)
+    elif state == "present":
         query_path = meraki.construct_path(
             "get_one",
             custom={
-                "serial": meraki.params["serial"],
-                "number": meraki.params["number"],
+                "serial": serial,
+                "number": params["number"],
             },
         )
         original = meraki.request(query_path, method="GET")
-        # Check voiceVlan to see if state is absent to remove the vlan.
-        if meraki.params.get("voice_vlan_state"):
-            if meraki.params.get("voice_vlan_state") == "absent":
-                payload["voiceVlan"] = None
-            else:
-                payload["voiceVlan"] = meraki.params.get("voice_vlan")
-        if meraki.params.get("mac_allow_list"):
-            macs = get_mac_list(
-                original.get("macAllowList"),
-                meraki.params["mac_allow_list"].get("macs"),
-                meraki.params["mac_allow_list"].get("state"),
-            )
-            payload["macAllowList"] = macs
-        # Evaluate Sticky Limit whether it was passed in or what is currently configured and was returned in GET call.
-        if meraki.params.get("sticky_mac_allow_list_limit"):
-            sticky_mac_limit = meraki.params.get("sticky_mac_allow_list_limit")
-        else:
-            sticky_mac_limit = original.get("stickyMacAllowListLimit")
-        if meraki.params.get("sticky_mac_allow_list"):
-            macs = get_mac_list(
-                original.get("stickyMacAllowList"),
-                meraki.params["sticky_mac_allow_list"].get("macs"),
-                meraki.params["sticky_mac_allow_list"].get("state"),
-            )
-            if int(sticky_mac_limit) < len(macs):
-                meraki.fail_json(
-                    msg="Stick MAC Allow List Limit must be equal to or greater than length of Sticky MAC Allow List."
-                )
-            payload["stickyMacAllowList"] = macs
-            payload["stickyMacAllowListLimit"] = sticky_mac_limit
-        payload = clear_vlan(meraki.params, payload)
-        proposed = payload.copy()
-        if meraki.params["type"] == "trunk":
-            proposed["voiceVlan"] = original[
-                "voiceVlan"
-            ]  # API shouldn't include voice VLAN on a trunk port
+        payload, proposed = construct_port_payload(meraki, params, original)
         # meraki.fail_json(msg='Compare', original=original, payload=payload)
-        if meraki.is_update_required(original, proposed, optional_ignore=["number"]):
+        if not port_matches(original, proposed) and meraki.is_update_required(
+            original, proposed, optional_ignore=["number"]
+        ):
             if meraki.check_mode is True:
                 original.update(proposed)
                 meraki.result["data"] = original
@@ -679,11 +902,11 @@ def main():
             path = meraki.construct_path(
                 "update",
                 custom={
-                    "serial": meraki.params["serial"],
-                    "number": meraki.params["number"],
+                    "serial": serial,
+                    "number": params["number"],
                 },
             )
-            response = meraki.request(path, method="PUT", payload=json.dumps(payload))
+            response = meraki.request(path, method="PUT", payload=meraki.dumps(payload))
             meraki.result["data"] = response
             meraki.result["changed"] = True
         else:
@@ -187,7 +187,7 @@ data:
 
 '''
 
-from ansible.module_utils.basic import AnsibleModule, json
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import MerakiModule, meraki_argument_spec
 
 param_map = {'allowed_rules': 'allowedrules',
@@ -200,6 +200,18 @@ param_map = {'allowed_rules': 'allowedrules',
              }
 
 
+def network_settings_match(original, payload):
+    ''' Compare the keys set in a network payload with the current settings '''
+    for key, value in payload.items():
+        if key == 'protectedNetworks':
+            current = original.get(key) or {}
+            if any(k not in current or current[k] != v for k, v in value.items()):
+                return False
+        elif key not in original or original[key] != value:
+            return False
+    return True
+
+
 def main():
 
     # define the available arguments/parameters that a user can pass to
@@ -248,20 +260,23 @@ def main():
     meraki.url_catalog['set_org'] = set_org_urls
     meraki.url_catalog['set_net'] = set_net_urls
 
+    state = meraki.params['state']
+    protected_networks = meraki.params['protected_networks']
+
     if not meraki.params['org_name'] and not meraki.params['org_id']:
         meraki.fail_json(msg='org_name or org_id parameters are required')
     if meraki.params['net_name'] and meraki.params['net_id']:
         meraki.fail_json(msg='net_name and net_id are mutually exclusive')
     if meraki.params['net_name'] is None and meraki.params['net_id'] is None:  # Organization param check
-        if meraki.params['state'] == 'present':
+        if state == 'present':
             if meraki.params['allowed_rules'] is None:
                 meraki.fail_json(msg='allowed_rules is required when state is present and no network is specified.')
     if meraki.params['net_name'] or meraki.params['net_id']:  # Network param check
-        if meraki.params['state'] == 'present':
-            if meraki.params['protected_networks'] is not None:
-                if meraki.params['protected_networks']['use_default'] is False and meraki.params['protected_networks']['included_cidr'] is None:
+        if state == 'present':
+            if protected_networks is not None:
+                if protected_networks['use_default'] is False and protected_networks['included_cidr'] is None:
                     meraki.fail_json(msg="included_cidr is required when use_default is False.")
-                if meraki.params['protected_networks']['use_default'] is False and meraki.params['protected_networks']['excluded_cidr'] is None:
+                if protected_networks['use_default'] is False and protected_networks['excluded_cidr'] is None:
                     meraki.fail_json(msg="excluded_cidr is required when use_default is False.")
 
     org_id = meraki.params['org_id']
@@ -273,33 +288,26 @@ def main():
         net_id = meraki.get_net_id(net_name=meraki.params['net_name'], data=nets)
 
     # Assemble payload
-    if meraki.params['state'] == 'present':
+    if state == 'present':
         if net_id is None:  # Create payload for organization
-            rules = []
-            for rule in meraki.params['allowed_rules']:
-                rules.append({'ruleId': rule['rule_id'],
-                              'message': rule['rule_message'],
-                              })
-            payload = {'allowedRules': rules}
+            payload = {'allowedRules': [{'ruleId': rule['rule_id'], 'message': rule['rule_message']}
+                                        for rule in meraki.params['allowed_rules']]}
         else:  # Create payload for network
             payload = dict()
             if meraki.params['mode']:
                 payload['mode'] = meraki.params['mode']
             if meraki.params['ids_rulesets']:
                 payload['idsRulesets'] = meraki.params['ids_rulesets']
-            if meraki.params['protected_networks']:
+            if protected_networks:
                 payload['protectedNetworks'] = {}
-                if meraki.params['protected_networks']['use_default']:
-                    payload['protectedNetworks'].update({'useDefault': meraki.params['protected_networks']['use_default']})
-                if meraki.params['protected_networks']['included_cidr']:
-                    payload['protectedNetworks'].update({'includedCidr': meraki.params['protected_networks']['included_cidr']})
-                if meraki.params['protected_networks']['excluded_cidr']:
-                    payload['protectedNetworks'].update({'excludedCidr': meraki.params['protected_networks']['excluded_cidr']})
-    elif meraki.params['state'] == 'absent':
-        if net_id is None:  # Create payload for organization
-            payload = {'allowedRules': []}
+                if protected_networks['use_default']:
+                    payload['protectedNetworks'].update({'useDefault': protected_networks['use_default']})
+                if protected_networks['included_cidr']:
+                    payload['protectedNetworks'].update({'includedCidr': protected_networks['included_cidr']})
+                if protected_networks['excluded_cidr']:
+                    payload['protectedNetworks'].update({'excludedCidr': protected_networks['excluded_cidr']})
 
-    if meraki.params['state'] == 'query':
+    if state == 'query':
         if net_id is None:  # Query settings for organization
             path = meraki.construct_path('query_org', org_id=org_id)
             data = meraki.request(path, method='GET')
@@ -308,18 +316,19 @@ def main():
         else:  # Query settings for network
             path = meraki.construct_path('query_net', net_id=net_id)
             data = meraki.request(path, method='GET')
-    elif meraki.params['state'] == 'present':
-        path = meraki.construct_path('query_org', org_id=org_id)
-        original = meraki.request(path, method='GET')
+    elif state == 'present':
         if net_id is None:  # Set configuration for organization
-            if meraki.is_update_required(original, payload, optional_ignore=['message']):
+            path = meraki.construct_path('query_org', org_id=org_id)
+            original = meraki.request(path, method='GET')
+            # Allowed rules are compared directly first as the full comparison walks every rule
+            if original != payload and meraki.is_update_required(original, payload, optional_ignore=['message']):
                 if meraki.module.check_mode is True:
                     original.update(payload)
                     meraki.result['data'] = original
                     meraki.result['changed'] = True
                     meraki.exit_json(**meraki.result)
                 path = meraki.construct_path('set_org', org_id=org_id)
-                data = meraki.request(path, method='PUT', payload=json.dumps(payload))
+                data = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
                 if meraki.status == 200:
                     meraki.result['data'] = data
                     meraki.result['changed'] = True
@@ -329,32 +338,34 @@ def main():
         else:  # Set configuration for network
             path = meraki.construct_path('query_net', net_id=net_id)
             original = meraki.request(path, method='GET')
-            if meraki.is_update_required(original, payload):
+            if not network_settings_match(original, payload) and meraki.is_update_required(original, payload):
                 if meraki.module.check_mode is True:
                     payload.update(original)
                     meraki.result['data'] = payload
                     meraki.result['changed'] = True
                     meraki.exit_json(**meraki.result)
                 path = meraki.construct_path('set_net', net_id=net_id)
-                data = meraki.request(path, method='PUT', payload=json.dumps(payload))
+                data = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
                 if meraki.status == 200:
                     meraki.result['data'] = data
                     meraki.result['changed'] = True
             else:
                 meraki.result['data'] = original
                 meraki.result['changed'] = False
-    elif meraki.params['state'] == 'absent':
-        if net_id is None:
-            path = meraki.construct_path('query_org', org_id=org_id)
-            original = meraki.request(path, method='GET')
-        if meraki.is_update_required(original, payload):
+    elif state == 'absent':
+        if net_id is not None:
+            meraki.fail_json(msg='state absent only clears allowed rules for an organization.')
+        path = meraki.construct_path('query_org', org_id=org_id)
+        original = meraki.request(path, method='GET')
+        if original.get('allowedRules'):  # Nothing to clear when there are no allowed rules
+            payload = {'allowedRules': []}
             if meraki.module.check_mode is True:
                 payload.update(original)
                 meraki.result['data'] = payload
                 meraki.result['changed'] = True
                 meraki.exit_json(**meraki.result)
             path = meraki.construct_path('set_org', org_id=org_id)
-            data = meraki.request(path, method='PUT', payload=json.dumps(payload))
+            data = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
             if meraki.status == 200:
                 meraki.result['data'] = data
                 meraki.result['changed'] = True
@@ -162,7 +162,7 @@ data:
             sample: true
 '''
 
-from ansible.module_utils.basic import AnsibleModule, json
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import MerakiModule, meraki_argument_spec
 
 
@@ -224,15 +224,14 @@ def main():
         meraki.fail_json(msg='net_name and net_id are mutually exclusive.')
     if meraki.params['port_type'] == 'access':
         if meraki.params['allowed_vlans'] is not None:
-            meraki.meraki.fail_json(msg='allowed_vlans is mutually exclusive with port type trunk.')
+            meraki.fail_json(msg='allowed_vlans is mutually exclusive with port type access.')
 
-    org_id = meraki.params['org_id']
-    if not org_id:
-        org_id = meraki.get_org_id(meraki.params['org_name'])
     net_id = meraki.params['net_id']
     if net_id is None:
-        nets = meraki.get_nets(org_id=org_id)
-        net_id = meraki.get_net_id(org_id, meraki.params['net_name'], data=nets)
+        org_id = meraki.params['org_id']
+        if not org_id:
+            org_id = meraki.get_org_id(meraki.params['org_name'])
+        net_id = meraki.get_net_id(net_name=meraki.params['net_name'], org_id=org_id)
 
     if meraki.params['state'] == 'query':
         if meraki.params['number'] is not None:
@@ -254,7 +253,7 @@ def main():
                 meraki.result['changed'] = True
                 meraki.exit_json(**meraki.result)
             path = meraki.construct_path('update', net_id=net_id, custom={'port_id': meraki.params['number']})
-            response = meraki.request(path, method='PUT', payload=json.dumps(payload))
+            response = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
             if meraki.status == 200:
                 meraki.result['data'] = response
                 meraki.result['changed'] = True
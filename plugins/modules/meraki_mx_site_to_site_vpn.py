@@ -167,7 +167,7 @@ data:
                     sample: true
 '''
 
-from ansible.module_utils.basic import AnsibleModule, json
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import MerakiModule, meraki_argument_spec
 from copy import deepcopy
 
@@ -175,15 +175,13 @@ from copy import deepcopy
 def assemble_payload(meraki):
     payload = {'mode': meraki.params['mode']}
     if meraki.params['hubs'] is not None:
-        payload['hubs'] = meraki.params['hubs']
-        for hub in payload['hubs']:
-            hub['hubId'] = hub.pop('hub_id')
-            hub['useDefaultRoute'] = hub.pop('use_default_route')
+        payload['hubs'] = [{'hubId': hub['hub_id'],
+                            'useDefaultRoute': hub['use_default_route'],
+                            } for hub in meraki.params['hubs']]
     if meraki.params['subnets'] is not None:
-        payload['subnets'] = meraki.params['subnets']
-        for subnet in payload['subnets']:
-            subnet['localSubnet'] = subnet.pop('local_subnet')
-            subnet['useVpn'] = subnet.pop('use_vpn')
+        payload['subnets'] = [{'localSubnet': subnet['local_subnet'],
+                               'useVpn': subnet['use_vpn'],
+                               } for subnet in meraki.params['subnets']]
     return payload
 
 
@@ -213,6 +211,7 @@ def main():
     # supports check mode
     module = AnsibleModule(argument_spec=argument_spec,
                            supports_check_mode=True,
+                           required_one_of=[('net_id', 'net_name')],
                            )
     meraki = MerakiModule(module, function='site_to_site_vpn')
 
@@ -228,16 +227,12 @@ def main():
 
     # manipulate or modify the state as needed (this is going to be the
     # part where your module will do what it needs to do)
-    org_id = meraki.params['org_id']
-    if org_id is None:
-        orgs = meraki.get_orgs()
-        for org in orgs:
-            if org['name'] == meraki.params['org_name']:
-                org_id = org['id']
     net_id = meraki.params['net_id']
     if net_id is None:
-        net_id = meraki.get_net_id(net_name=meraki.params['net_name'],
-                                   data=meraki.get_nets(org_id=org_id))
+        org_id = meraki.params['org_id']
+        if not org_id:
+            org_id = meraki.get_org_id(meraki.params['org_name'])
+        net_id = meraki.get_net_id(net_name=meraki.params['net_name'], org_id=org_id)
 
     if meraki.params['state'] == 'query':
         path = meraki.construct_path('get_all', net_id=net_id)
@@ -255,7 +250,7 @@ def main():
                 meraki.result['data'] = payload
                 meraki.exit_json(**meraki.result)
             path = meraki.construct_path('update', net_id=net_id)
-            response = meraki.request(path, method='PUT', payload=json.dumps(payload))
+            response = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
             meraki.result['changed'] = True
             meraki.result['data'] = response
         else:
@@ -224,10 +224,20 @@ data:
               sample: JimLaptop
 """
 
-from ansible.module_utils.basic import AnsibleModule, json
+from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import (
     MerakiModule,
     meraki_argument_spec,
+    only_set,
+)
+
+ROUTE_FIELDS = (
+    ("name", "name"),
+    ("subnet", "subnet"),
+    ("gateway_ip", "gatewayIp"),
+    ("reserved_ip_ranges", "reservedIpRanges"),
+    ("enabled", "enabled"),
+    ("gateway_vlan_id", "gatewayVlanId"),
 )
 
 
@@ -238,6 +248,15 @@ def fixed_ip_factory(meraki, data):
     return fixed_ips
 
 
+def construct_payload(meraki):
+    payload = only_set(meraki.params, ROUTE_FIELDS)
+    if meraki.params["fixed_ip_assignments"] is not None:
+        payload["fixedIpAssignments"] = fixed_ip_factory(
+            meraki, meraki.params["fixed_ip_assignments"]
+        )
+    return payload
+
+
 def get_static_routes(meraki, net_id):
     path = meraki.construct_path("get_all", net_id=net_id)
     r = meraki.request(path, method="GET")
@@ -330,9 +349,9 @@ def main():
     }
     meraki.url_catalog["get_all"].update(query_urls)
     meraki.url_catalog["get_one"].update(query_one_urls)
-    meraki.url_catalog["create"] = create_urls
-    meraki.url_catalog["update"] = update_urls
-    meraki.url_catalog["delete"] = delete_urls
+    meraki.url_catalog.update(
+        create=create_urls, update=update_urls, delete=delete_urls
+    )
 
     if not meraki.params["org_name"] and not meraki.params["org_id"]:
         meraki.fail_json(
@@ -370,22 +389,6 @@ def main():
         else:
             meraki.result["data"] = get_static_routes(meraki, net_id)
     elif meraki.params["state"] == "present":
-        payload = {
-            "name": meraki.params["name"],
-            "subnet": meraki.params["subnet"],
-            "gatewayIp": meraki.params["gateway_ip"],
-        }
-        if meraki.params["fixed_ip_assignments"] is not None:
-            payload["fixedIpAssignments"] = fixed_ip_factory(
-                meraki, meraki.params["fixed_ip_assignments"]
-            )
-        if meraki.params["reserved_ip_ranges"] is not None:
-            payload["reservedIpRanges"] = meraki.params["reserved_ip_ranges"]
-        if meraki.params["enabled"] is not None:
-            payload["enabled"] = meraki.params["enabled"]
-        if meraki.params["gateway_vlan_id"] is not None:
-            payload["gatewayVlanId"] = meraki.params["gateway_vlan_id"]
-
         route_id = meraki.params["route_id"]
         if meraki.params["name"] is not None and route_id is None:
             route_status = does_route_exist(
@@ -397,7 +400,7 @@ def main():
         if route_id is not None:
             existing_route = get_static_route(meraki, net_id, route_id)
             original = existing_route.copy()
-            payload = update_dict(existing_route, payload)
+            payload = update_dict(existing_route, construct_payload(meraki))
             if module.check_mode:
                 meraki.result["data"] = payload
                 meraki.exit_json(**meraki.result)
@@ -406,18 +409,22 @@ def main():
                     "update", net_id=net_id, custom={"route_id": route_id}
                 )
                 meraki.result["data"] = meraki.request(
-                    path, method="PUT", payload=json.dumps(payload)
+                    path, method="PUT", payload=meraki.dumps(payload)
+                )
+                # The API may normalize the request so the route ends up unchanged
+                meraki.result["changed"] = meraki.is_update_required(
+                    original, meraki.result["data"], optional_ignore=["id"]
                 )
-                meraki.result["changed"] = True
             else:
                 meraki.result["data"] = original
         else:
+            payload = construct_payload(meraki)
             if module.check_mode:
                 meraki.result["data"] = payload
                 meraki.exit_json(**meraki.result)
             path = meraki.construct_path("create", net_id=net_id)
             meraki.result["data"] = meraki.request(
-                path, method="POST", payload=json.dumps(payload)
+                path, method="POST", payload=meraki.dumps(payload)
             )
             meraki.result["changed"] = True
     elif meraki.params["state"] == "absent":
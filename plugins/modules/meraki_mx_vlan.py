@@ -44,6 +44,137 @@ options:
       - ID number of VLAN.
       - ID should be between 1-4096.
       type: int
+    vlans:
+      description:
+      - List of VLANs to create or update with C(state=present), or delete with C(state=absent), in one task.
+      - The VLANs of the network are downloaded once and only VLANs which differ are changed.
+      - Mutually exclusive with C(vlan_id).
+      type: list
+      elements: dict
+      suboptions:
+        vlan_id:
+          description:
+          - ID number of VLAN.
+          - ID should be between 1-4096.
+          type: int
+          required: true
+        name:
+          description:
+          - Name of VLAN.
+          aliases: [vlan_name]
+          type: str
+        subnet:
+          description:
+          - CIDR notation of network subnet.
+          type: str
+        appliance_ip:
+          description:
+          - IP address of appliance.
+          - Address must be within subnet specified in C(subnet) parameter.
+          type: str
+        dns_nameservers:
+          description:
+          - Semi-colon delimited list of DNS IP addresses.
+          - Specify one of the following options for preprogrammed DNS entries opendns, google_dns, upstream_dns
+          type: str
+        reserved_ip_range:
+          description:
+          - IP address ranges which should be reserve and not distributed via DHCP.
+          type: list
+          elements: dict
+          suboptions:
+            start:
+              description: First IP address of reserved IP address range, inclusive.
+              type: str
+            end:
+              description: Last IP address of reserved IP address range, inclusive.
+              type: str
+            comment:
+              description: Description of IP addresses reservation
+              type: str
+        vpn_nat_subnet:
+          description:
+          - The translated VPN subnet if VPN and VPN subnet translation are enabled on the VLAN.
+          type: str
+        fixed_ip_assignments:
+          description:
+          - Static IP address assignments to be distributed via DHCP by MAC address.
+          type: list
+          elements: dict
+          suboptions:
+            mac:
+              description: MAC address for fixed IP assignment binding.
+              type: str
+            ip:
+              description: IP address for fixed IP assignment binding.
+              type: str
+            name:
+              description: Descriptive name of IP assignment binding.
+              type: str
+        dhcp_handling:
+            description:
+            - How to handle DHCP packets on network.
+            type: str
+            choices: ['Run a DHCP server',
+                      'Relay DHCP to another server',
+                      'Do not respond to DHCP requests',
+                      'none',
+                      'server',
+                      'relay']
+        dhcp_relay_server_ips:
+            description:
+            - IP addresses to forward DHCP packets to.
+            type: list
+            elements: str
+        dhcp_lease_time:
+            description:
+            - DHCP lease timer setting
+            type: str
+            choices: ['30 minutes',
+                      '1 hour',
+                      '4 hours',
+                      '12 hours',
+                      '1 day',
+                      '1 week']
+        dhcp_boot_options_enabled:
+            description:
+            - Enable DHCP boot options
+            type: bool
+        dhcp_boot_next_server:
+            description:
+            - DHCP boot option to direct boot clients to the server to load boot file from.
+            type: str
+        dhcp_boot_filename:
+            description:
+            - Filename to boot from for DHCP boot
+            type: str
+        dhcp_options:
+            description:
+            - List of DHCP option values
+            type: list
+            elements: dict
+            suboptions:
+                code:
+                    description:
+                    - DHCP option number.
+                    type: int
+                type:
+                    description:
+                    - Type of value for DHCP option.
+                    type: str
+                    choices: ['text', 'ip', 'hex', 'integer']
+                value:
+                    description:
+                    - Value for DHCP option.
+                    type: str
+    use_action_batches:
+      description:
+      - Submit the changes for C(vlans) as synchronous action batches of up to 20 actions, instead of one request per VLAN.
+      - Only applies to C(vlans) and cannot be used with C(vlan_id).
+      - Requires C(org_name) or C(org_id).
+      - Each batch is applied atomically, but batches which completed before a failing batch are not rolled back.
+      type: bool
+      default: false
     name:
       description:
       - Name of VLAN.
@@ -236,6 +367,23 @@ EXAMPLES = r'''
     state: absent
     vlan_id: 2
   delegate_to: localhost
+
+- name: Create or update several VLANs in one task.
+  meraki_vlan:
+    auth_key: abc12345
+    org_name: YourOrg
+    net_name: YourNet
+    state: present
+    vlans:
+      - vlan_id: 2
+        name: TestVLAN
+        subnet: 192.0.1.0/24
+        appliance_ip: 192.0.1.1
+      - vlan_id: 3
+        name: TestVLAN3
+        subnet: 192.0.3.0/24
+        appliance_ip: 192.0.3.1
+  delegate_to: localhost
 '''
 
 RETURN = r'''
@@ -368,130 +516,164 @@ response:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.meraki.plugins.module_utils.network.meraki.meraki import MerakiModule, meraki_argument_spec
-import json
+
+
+VLAN_FIELDS = (('reserved_ip_range', 'reservedIpRanges'),
+               ('vpn_nat_subnet', 'vpnNatSubnet'),
+               ('dhcp_relay_server_ips', 'dhcpRelayServerIps'),
+               ('dhcp_lease_time', 'dhcpLeaseTime'),
+               ('dhcp_boot_options_enabled', 'dhcpBootOptionsEnabled'),
+               ('dhcp_boot_next_server', 'dhcpBootNextServer'),
+               ('dhcp_boot_filename', 'dhcpBootFilename'),
+               ('dhcp_options', 'dhcpOptions'),
+               )
+
+# Synchronous action batches may contain at most 20 actions
+ACTION_BATCH_SIZE = 20
+
+DHCP_HANDLING = {'none': 'Do not respond to DHCP requests',
+                 'server': 'Run a DHCP server',
+                 'relay': 'Relay DHCP to another server',
+                 }
+
+
+FIXED_IP_ARG_SPEC = dict(mac=dict(type='str'),
+                         ip=dict(type='str'),
+                         name=dict(type='str'),
+                         )
+
+RESERVED_IP_ARG_SPEC = dict(start=dict(type='str'),
+                            end=dict(type='str'),
+                            comment=dict(type='str'),
+                            )
+
+DHCP_OPTIONS_ARG_SPEC = dict(code=dict(type='int'),
+                             type=dict(type='str', choices=['text', 'ip', 'hex', 'integer']),
+                             value=dict(type='str'),
+                             )
+
+VLAN_ARG_SPEC = dict(name=dict(type='str', aliases=['vlan_name']),
+                     subnet=dict(type='str'),
+                     appliance_ip=dict(type='str'),
+                     fixed_ip_assignments=dict(type='list', default=None, elements='dict', options=FIXED_IP_ARG_SPEC),
+                     reserved_ip_range=dict(type='list', default=None, elements='dict', options=RESERVED_IP_ARG_SPEC),
+                     vpn_nat_subnet=dict(type='str'),
+                     dns_nameservers=dict(type='str'),
+                     dhcp_handling=dict(type='str', choices=['Run a DHCP server',
+                                                             'Relay DHCP to another server',
+                                                             'Do not respond to DHCP requests',
+                                                             'none',
+                                                             'server',
+                                                             'relay'],
+                                        ),
+                     dhcp_relay_server_ips=dict(type='list', default=None, elements='str'),
+                     dhcp_lease_time=dict(type='str', choices=['30 minutes',
+                                                               '1 hour',
+                                                               '4 hours',
+                                                               '12 hours',
+                                                               '1 day',
+                                                               '1 week']),
+                     dhcp_boot_options_enabled=dict(type='bool'),
+                     dhcp_boot_next_server=dict(type='str'),
+                     dhcp_boot_filename=dict(type='str'),
+                     dhcp_options=dict(type='list', default=None, elements='dict', options=DHCP_OPTIONS_ARG_SPEC),
+                     )
+
+VLANS_ARG_SPEC = dict(vlan_id=dict(type='int', required=True))
+VLANS_ARG_SPEC.update(VLAN_ARG_SPEC)
 
 
 def fixed_ip_factory(meraki, data):
-    fixed_ips = dict()
-    for item in data:
-        fixed_ips[item['mac']] = {'ip': item['ip'], 'name': item['name']}
+    fixed_ips = dict((item['mac'], {'ip': item['ip'], 'name': item['name']}) for item in data)
+    if len(fixed_ips) != len(data):
+        meraki.fail_json(msg='MAC addresses in fixed_ip_assignments must be unique.')
     return fixed_ips
 
 
 def get_vlans(meraki, net_id):
     path = meraki.construct_path('get_all', net_id=net_id)
-    return meraki.request(path, method='GET')
+    return meraki.cached_get(path)
 
 
-# TODO: Allow method to return actual item if True to reduce number of calls needed
-def is_vlan_valid(meraki, net_id, vlan_id):
-    vlans = get_vlans(meraki, net_id)
-    for vlan in vlans:
-        if vlan_id == vlan['id']:
-            return True
-    return False
+def get_vlan(meraki, net_id, vlan_id):
+    path = meraki.construct_path('get_one', net_id=net_id, custom={'vlan_id': vlan_id})
+    response = meraki.request(path, method='GET', ignored_codes=[404])
+    if meraki.status == 404:
+        return False, None
+    return True, response
 
 
-def construct_payload(meraki):
-    payload = {'id': meraki.params['vlan_id'],
-               'name': meraki.params['name'],
-               'subnet': meraki.params['subnet'],
-               'applianceIp': meraki.params['appliance_ip'],
+def construct_payload(meraki, params):
+    payload = {'id': params['vlan_id'],
+               'name': params['name'],
+               'subnet': params['subnet'],
+               'applianceIp': params['appliance_ip'],
                }
-    if meraki.params['dns_nameservers']:
-        if meraki.params['dns_nameservers'] not in ('opendns', 'google_dns', 'upstream_dns'):
-            payload['dnsNameservers'] = format_dns(meraki.params['dns_nameservers'])
+    payload.update((api, params[key]) for key, api in VLAN_FIELDS if params[key])
+    if params['dns_nameservers']:
+        if params['dns_nameservers'] not in ('opendns', 'google_dns', 'upstream_dns'):
+            payload['dnsNameservers'] = format_dns(params['dns_nameservers'])
         else:
-            payload['dnsNameservers'] = meraki.params['dns_nameservers']
-    if meraki.params['fixed_ip_assignments']:
-        payload['fixedIpAssignments'] = fixed_ip_factory(meraki, meraki.params['fixed_ip_assignments'])
-    if meraki.params['reserved_ip_range']:
-        payload['reservedIpRanges'] = meraki.params['reserved_ip_range']
-    if meraki.params['vpn_nat_subnet']:
-        payload['vpnNatSubnet'] = meraki.params['vpn_nat_subnet']
-    if meraki.params['dhcp_handling']:
-        payload['dhcpHandling'] = normalize_dhcp_handling(meraki.params['dhcp_handling'])
-    if meraki.params['dhcp_relay_server_ips']:
-        payload['dhcpRelayServerIps'] = meraki.params['dhcp_relay_server_ips']
-    if meraki.params['dhcp_lease_time']:
-        payload['dhcpLeaseTime'] = meraki.params['dhcp_lease_time']
-    if meraki.params['dhcp_boot_options_enabled']:
-        payload['dhcpBootOptionsEnabled'] = meraki.params['dhcp_boot_options_enabled']
-    if meraki.params['dhcp_boot_next_server']:
-        payload['dhcpBootNextServer'] = meraki.params['dhcp_boot_next_server']
-    if meraki.params['dhcp_boot_filename']:
-        payload['dhcpBootFilename'] = meraki.params['dhcp_boot_filename']
-    if meraki.params['dhcp_options']:
-        payload['dhcpOptions'] = meraki.params['dhcp_options']
-    # if meraki.params['dhcp_handling']:
-    #     meraki.fail_json(payload)
-
+            payload['dnsNameservers'] = params['dns_nameservers']
+    if params['fixed_ip_assignments']:
+        payload['fixedIpAssignments'] = fixed_ip_factory(meraki, params['fixed_ip_assignments'])
+    if params['dhcp_handling']:
+        payload['dhcpHandling'] = normalize_dhcp_handling(params['dhcp_handling'])
     return payload
 
 
+def canonicalize(vlan):
+    """Return a copy of a VLAN with list order and DHCP option codes normalized for comparison."""
+    vlan = dict(vlan)
+    if vlan.get('reservedIpRanges'):
+        vlan['reservedIpRanges'] = sorted(vlan['reservedIpRanges'],
+                                          key=lambda ip_range: (str(ip_range.get('start')), str(ip_range.get('end'))))
+    if vlan.get('dhcpOptions'):
+        options = [dict(option, code=str(option['code'])) if option.get('code') is not None else option
+                   for option in vlan['dhcpOptions']]
+        vlan['dhcpOptions'] = sorted(options, key=lambda option: str(option.get('code')))
+    return vlan
+
+
+def vlan_matches(original, payload):
+    """Return True when every payload value other than the VLAN ID is already configured."""
+    return all(key in original and original[key] == value for key, value in payload.items() if key != 'id')
+
+
+def run_action_batches(meraki, org_id, actions):
+    path = meraki.construct_path('action_batch', org_id=org_id)
+    for start in range(0, len(actions), ACTION_BATCH_SIZE):
+        payload = {'confirmed': True,
+                   'synchronous': True,
+                   'actions': actions[start:start + ACTION_BATCH_SIZE],
+                   }
+        response = meraki.request(path, method='POST', payload=meraki.dumps(payload))
+        status = response.get('status', {})
+        if status.get('failed'):
+            meraki.fail_json(msg='Action batch {0} failed'.format(response.get('id')), errors=status.get('errors'))
+
+
 def format_dns(nameservers):
     return nameservers.replace(';', '\n')
 
 
 def normalize_dhcp_handling(parameter):
-    if parameter == 'none':
-        return 'Do not respond to DHCP requests'
-    elif parameter == 'server':
-        return 'Run a DHCP server'
-    elif parameter == 'relay':
-        return 'Relay DHCP to another server'
+    return DHCP_HANDLING.get(parameter, parameter)
 
 
 def main():
     # define the available arguments/parameters that a user can pass to
     # the module
 
-    fixed_ip_arg_spec = dict(mac=dict(type='str'),
-                             ip=dict(type='str'),
-                             name=dict(type='str'),
-                             )
-
-    reserved_ip_arg_spec = dict(start=dict(type='str'),
-                                end=dict(type='str'),
-                                comment=dict(type='str'),
-                                )
-
-    dhcp_options_arg_spec = dict(code=dict(type='int'),
-                                 type=dict(type='str', choices=['text', 'ip', 'hex', 'integer']),
-                                 value=dict(type='str'),
-                                 )
-
     argument_spec = meraki_argument_spec()
     argument_spec.update(state=dict(type='str', choices=['absent', 'present', 'query'], default='query'),
                          net_name=dict(type='str', aliases=['network']),
                          net_id=dict(type='str'),
                          vlan_id=dict(type='int'),
-                         name=dict(type='str', aliases=['vlan_name']),
-                         subnet=dict(type='str'),
-                         appliance_ip=dict(type='str'),
-                         fixed_ip_assignments=dict(type='list', default=None, elements='dict', options=fixed_ip_arg_spec),
-                         reserved_ip_range=dict(type='list', default=None, elements='dict', options=reserved_ip_arg_spec),
-                         vpn_nat_subnet=dict(type='str'),
-                         dns_nameservers=dict(type='str'),
-                         dhcp_handling=dict(type='str', choices=['Run a DHCP server',
-                                                                 'Relay DHCP to another server',
-                                                                 'Do not respond to DHCP requests',
-                                                                 'none',
-                                                                 'server',
-                                                                 'relay'],
-                                            ),
-                         dhcp_relay_server_ips=dict(type='list', default=None, elements='str'),
-                         dhcp_lease_time=dict(type='str', choices=['30 minutes',
-                                                                   '1 hour',
-                                                                   '4 hours',
-                                                                   '12 hours',
-                                                                   '1 day',
-                                                                   '1 week']),
-                         dhcp_boot_options_enabled=dict(type='bool'),
-                         dhcp_boot_next_server=dict(type='str'),
-                         dhcp_boot_filename=dict(type='str'),
-                         dhcp_options=dict(type='list', default=None, elements='dict', options=dhcp_options_arg_spec),
+                         vlans=dict(type='list', elements='dict', options=VLANS_ARG_SPEC),
+                         use_action_batches=dict(type='bool', default=False),
                          )
+    argument_spec.update(VLAN_ARG_SPEC)
 
     # the AnsibleModule object will be our abstraction working with Ansible
     # this includes instantiation, a couple of common attr would be the
@@ -499,6 +681,7 @@ def main():
     # supports check mode
     module = AnsibleModule(argument_spec=argument_spec,
                            supports_check_mode=True,
+                           mutually_exclusive=[('vlan_id', 'vlans')],
                            )
     meraki = MerakiModule(module, function='vlan')
 
@@ -515,16 +698,22 @@ def main():
     meraki.url_catalog['create'] = create_url
     meraki.url_catalog['update'] = update_url
     meraki.url_catalog['delete'] = delete_url
+    meraki.url_catalog['action_batch'] = {'vlan': '/organizations/{org_id}/actionBatches'}
+
+    if meraki.params['use_action_batches']:
+        if meraki.params['vlans'] is None:
+            meraki.fail_json(msg='use_action_batches is only supported with vlans')
+        if not meraki.params['org_name'] and not meraki.params['org_id']:
+            meraki.fail_json(msg='org_name or org_id is required when use_action_batches is set')
 
     payload = None
 
-    org_id = meraki.params['org_id']
-    if org_id is None:
-        org_id = meraki.get_org_id(meraki.params['org_name'])
     net_id = meraki.params['net_id']
     if net_id is None:
-        nets = meraki.get_nets(org_id=org_id)
-        net_id = meraki.get_net_id(net_name=meraki.params['net_name'], data=nets)
+        org_id = meraki.params['org_id']
+        if org_id is None:
+            org_id = meraki.get_org_id(meraki.params['org_name'])
+        net_id = meraki.get_net_id(net_name=meraki.params['net_name'], org_id=org_id)
 
     if meraki.params['state'] == 'query':
         if not meraki.params['vlan_id']:
@@ -533,30 +722,83 @@ def main():
             path = meraki.construct_path('get_one', net_id=net_id, custom={'vlan_id': meraki.params['vlan_id']})
             response = meraki.request(path, method='GET')
             meraki.result['data'] = response
+    elif meraki.params['vlans'] is not None:
+        # Download every VLAN once instead of one GET per VLAN
+        path = meraki.construct_path('get_all', net_id=net_id)
+        existing = dict((str(vlan['id']), vlan) for vlan in meraki.request(path, method='GET'))
+        # Changes are collected and submitted as action batches instead of one request each
+        actions = [] if meraki.params['use_action_batches'] else None
+        meraki.result['data'] = []
+        for vlan in meraki.params['vlans']:
+            original = existing.get(str(vlan['vlan_id']))
+            if meraki.params['state'] == 'absent':
+                if original is None:
+                    continue
+                meraki.result['changed'] = True
+                if meraki.module.check_mode is False:
+                    path = meraki.construct_path('delete', net_id=net_id) + str(vlan['vlan_id'])
+                    if actions is not None:
+                        actions.append({'resource': path, 'operation': 'destroy'})
+                    else:
+                        meraki.request(path, 'DELETE')
+                continue
+            payload = construct_payload(meraki, vlan)
+            current = canonicalize(original) if original is not None else None
+            proposed = canonicalize(payload)
+            if original is None:  # Create new VLAN
+                meraki.result['changed'] = True
+                path = meraki.construct_path('create', net_id=net_id)
+                if meraki.module.check_mode is True or actions is not None:
+                    if actions is not None:
+                        actions.append({'resource': path, 'operation': 'create', 'body': payload})
+                    meraki.result['data'].append(payload)
+                    continue
+                response = meraki.request(path, method='POST', payload=meraki.dumps(payload))
+                meraki.result['data'].append(response)
+            elif not vlan_matches(current, proposed) and \
+                    meraki.is_update_required(current, proposed, optional_ignore=['networkId']):
+                meraki.result['changed'] = True
+                path = meraki.construct_path('update', net_id=net_id) + str(vlan['vlan_id'])
+                if meraki.module.check_mode is True or actions is not None:
+                    if actions is not None:
+                        actions.append({'resource': path, 'operation': 'update', 'body': payload})
+                    original.update(payload)
+                    meraki.result['data'].append(original)
+                    continue
+                response = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
+                meraki.result['data'].append(response)
+            else:
+                meraki.result['data'].append(original)
+        if actions and meraki.module.check_mode is False:
+            org_id = meraki.params['org_id']
+            if org_id is None:
+                org_id = meraki.get_org_id(meraki.params['org_name'])
+            run_action_batches(meraki, org_id, actions)
     elif meraki.params['state'] == 'present':
-        payload = construct_payload(meraki)
-        if is_vlan_valid(meraki, net_id, meraki.params['vlan_id']) is False:  # Create new VLAN
+        payload = construct_payload(meraki, meraki.params)
+        exists, original = get_vlan(meraki, net_id, meraki.params['vlan_id'])
+        if exists is False:  # Create new VLAN
             if meraki.module.check_mode is True:
                 meraki.result['data'] = payload
                 meraki.result['changed'] = True
                 meraki.exit_json(**meraki.result)
             path = meraki.construct_path('create', net_id=net_id)
-            response = meraki.request(path, method='POST', payload=json.dumps(payload))
+            response = meraki.request(path, method='POST', payload=meraki.dumps(payload))
             meraki.result['changed'] = True
             meraki.result['data'] = response
         else:  # Update existing VLAN
-            path = meraki.construct_path('get_one', net_id=net_id, custom={'vlan_id': meraki.params['vlan_id']})
-            original = meraki.request(path, method='GET')
             ignored = ['networkId']
-            if meraki.is_update_required(original, payload, optional_ignore=ignored):
-                meraki.generate_diff(original, payload)
+            current = canonicalize(original)
+            proposed = canonicalize(payload)
+            if not vlan_matches(current, proposed) and meraki.is_update_required(current, proposed, optional_ignore=ignored):
                 if meraki.module.check_mode is True:
+                    meraki.generate_diff(original, payload)
                     original.update(payload)
                     meraki.result['changed'] = True
                     meraki.result['data'] = original
                     meraki.exit_json(**meraki.result)
                 path = meraki.construct_path('update', net_id=net_id) + str(meraki.params['vlan_id'])
-                response = meraki.request(path, method='PUT', payload=json.dumps(payload))
+                response = meraki.request(path, method='PUT', payload=meraki.dumps(payload))
                 meraki.result['changed'] = True
                 meraki.result['data'] = response
                 meraki.generate_diff(original, response)
@@ -566,7 +808,7 @@ def main():
                     meraki.exit_json(**meraki.result)
                 meraki.result['data'] = original
     elif meraki.params['state'] == 'absent':
-        if is_vlan_valid(meraki, net_id, meraki.params['vlan_id']):
+        if get_vlan(meraki, net_id, meraki.params['vlan_id'])[0]:
             if meraki.module.check_mode is True:
                 meraki.result['data'] = {}
                 meraki.result['changed'] = True